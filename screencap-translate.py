@@ -1,11 +1,22 @@
 import numpy as np
 import cv2
-import pytesseract
-import deepl
 import pynput
 import PIL.ImageGrab
 
 from config import DEEPL_KEY, HOTKEY
+import st.client
+import st.ocr
+import st.translate
+
+OCR_CONFIG = ''  # Tesseract's default, fully automatic page segmentation
+
+def ocr_translate_with_daemon(roi: np.ndarray):
+    # Engines and translator are already warm in the daemon (screencap_translate_daemon.py)
+    try:
+        with st.client.DaemonClient() as client:
+            return client.ocr_translate(roi, lang='eng', target_lang='DE', config=OCR_CONFIG)
+    except OSError:  # Daemon not running, gone or not responding
+        return None
 
 def on_hotkey():
 
@@ -16,21 +27,28 @@ def on_hotkey():
 
     x, y, w, h = coords
     roi = img[y:y+h, x:x+w]
+    if roi.size == 0:  # Selection was cancelled
+        return
 
     #cv2.imshow('roi', roi)
     #cv2.waitKey(0)
     #cv2.destroyAllWindows()
 
-
-    text = pytesseract.image_to_string(roi, lang='eng')
-    print(text)
-
-    text_clean = text.replace('\n', ' ')
-
-
-    translator = deepl.Translator(DEEPL_KEY)
-    result = translator.translate_text(text_clean, target_lang='DE')
-    print(f'Translated: {result.text}')
+    try:
+        result = ocr_translate_with_daemon(roi)
+    except RuntimeError as e:  # Raised in the daemon, e.g. missing OCR language or DeepL key; keep the hotkey alive
+        print(f'Daemon error: {e}')
+        return
+    if result is None:
+        text_clean = st.ocr.ocr_text(roi, to_lang='eng', config=OCR_CONFIG)
+        translated = ''
+        if text_clean:  # Same as the daemon, which does not send empty text to DeepL
+            translated = st.translate.translate_text_deepl(text_clean, api_key=DEEPL_KEY, target_lang='DE')
+    else:
+        text_clean, translated = result
+
+    print(text_clean)
+    print(f'Translated: {translated}')
 
 
 print(HOTKEY)
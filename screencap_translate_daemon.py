@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+import argparse
+import sys
+
+import numpy as np
+import PIL.Image
+
+import config
+from st.client import DaemonClient
+from st.ocr import DEFAULT_OCR_CONFIG
+from st.daemon import TranslateServer
+from st.ipc import get_socket_path
+
+parser = argparse.ArgumentParser(prog="screencap_translate_daemon.py",
+                                 description="Background service doing OCR and translation for thin clients. "
+                                             "With --client, send an image to the running service instead")
+parser.add_argument("--socket", default=get_socket_path(),
+                    help="Path of the Unix domain socket to listen on (or to connect to with --client)")
+parser.add_argument("--ocr-engines", type=int, default=2, help="Number of tesseract engines per OCR language")
+parser.add_argument("--languages", nargs="*", default=["eng"], help="OCR languages to load on startup")
+parser.add_argument("--ocr-config", nargs="+", default=[DEFAULT_OCR_CONFIG, ""],
+                    help="Tesseract configs to load the startup engines for, should match what clients send "
+                         "(default: the GUI's and the hotkey script's). The first one is used with --client")
+parser.add_argument("--client", metavar="IMAGE", help="OCR and translate IMAGE using the running service")
+parser.add_argument("--ocr-lang", default="eng", help="OCR language for --client")
+parser.add_argument("--target-lang", default="DE", help="Translation target language for --client")
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    if args.client:
+        img = np.array(PIL.Image.open(args.client).convert("RGB"))  # Palette, LA, 16 bit etc. as plain pixels
+        try:
+            with DaemonClient(args.socket) as client:
+                text, translated = client.ocr_translate(img, lang=args.ocr_lang, target_lang=args.target_lang,
+                                                        config=args.ocr_config[0])
+        except OSError as e:
+            print(f"Could not reach the daemon on {args.socket}, is it running? ({e})")
+            sys.exit(1)
+        except RuntimeError as e:
+            print(f"Daemon error: {e}")
+            sys.exit(1)
+        print(text)
+        print(f"Translated: {translated}")
+        sys.exit()
+
+    with TranslateServer(args.socket, api_key=config.DEEPL_KEY, ocr_engines=args.ocr_engines) as server:
+        server.warm_up(args.languages, ocr_configs=args.ocr_config)
+        print(f"Listening on {args.socket}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            sys.exit()
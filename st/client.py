@@ -0,0 +1,73 @@
+import socket
+import threading
+from typing import Optional
+
+import numpy as np
+
+import st.ipc
+
+
+class DaemonClient:
+    """Thin client for TranslateServer (see st/daemon.py); one connection, reused for all requests"""
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: float = 30.0):
+        if not st.ipc.unix_sockets_available():
+            raise OSError("The daemon needs Unix domain sockets, which are not available on this platform")
+        if socket_path is None:
+            socket_path = st.ipc.get_socket_path()
+        st.ipc.check_socket_owner(socket_path)
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.settimeout(timeout)
+        try:
+            self.socket.connect(socket_path)
+        except OSError:
+            self.socket.close()
+            raise
+        self.file = self.socket.makefile("rwb")
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.file.close()
+        self.socket.close()
+
+    def request(self, message: dict) -> dict:
+        with self._lock:
+            self.file.write(st.ipc.encode_message(message))
+            self.file.flush()
+            line = self.file.readline()
+        if not line:
+            raise ConnectionError("Daemon closed the connection")
+        response = st.ipc.decode_message(line)
+        if not response.get("ok"):
+            raise RuntimeError(response.get("error", "Unknown daemon error"))
+        return response
+
+    def ping(self):
+        self.request({"command": "ping"})
+
+    def ocr(self, img: np.ndarray, lang: str = "eng", config: str = "") -> str:
+        return self._image_request({"command": "ocr", "lang": lang, "config": config}, img)["text"]
+
+    def translate(self, text: str, target_lang: str = "DE") -> str:
+        return self.request({"command": "translate", "text": text, "target_lang": target_lang})["text"]
+
+    def ocr_translate(self, img: np.ndarray, lang: str = "eng", target_lang: str = "DE",
+                      config: str = "") -> tuple[str, str]:
+        response = self._image_request({"command": "ocr_translate", "lang": lang, "target_lang": target_lang,
+                                         "config": config}, img)
+        return response["text"], response["translated"]
+
+    def _image_request(self, message: dict, img: np.ndarray) -> dict:
+        shm, image_info = st.ipc.image_to_shared_memory(img)
+        try:
+            return self.request({**message, **image_info})
+        finally:
+            shm.close()
+            shm.unlink()
+
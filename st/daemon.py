@@ -0,0 +1,113 @@
+import collections
+import functools
+import hashlib
+import os
+import socket
+import socketserver
+import threading
+from typing import Optional
+
+import st.ipc
+import st.ocr
+import st.translate
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        # A connection can be kept open by the client for any number of requests
+        for line in self.rfile:
+            try:
+                response = {"ok": True, **self.server.handle_request(st.ipc.decode_message(line))}
+            except Exception as e:
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(st.ipc.encode_message(response))
+            self.wfile.flush()
+
+
+class TranslateServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Headless service keeping OCR engines, the DeepL connection and result caches warm between requests"""
+    daemon_threads = True
+
+    def __init__(self, socket_path: Optional[str] = None, api_key: str = "",
+                 ocr_engines: int = 2, cache_size: int = 256):
+        if socket_path is None:
+            socket_path = st.ipc.get_socket_path()
+        self.api_key = api_key
+        self.ocr_pool = st.ocr.TesseractPool(ocr_engines)
+        self.cache_size = cache_size
+        self._ocr_cache = collections.OrderedDict()
+        self._ocr_cache_lock = threading.Lock()
+        self.translate = functools.lru_cache(maxsize=cache_size)(self._translate)
+        st.ipc.prepare_socket_dir(socket_path)
+        remove_stale_socket(socket_path)
+        self._bound = False  # server_close() also runs after a failed bind, when the socket is someone else's
+        super().__init__(socket_path, RequestHandler)
+
+    def server_bind(self):
+        super().server_bind()
+        self._bound = True
+        os.chmod(self.server_address, 0o600)  # Only the user running the daemon may send requests
+
+    def server_close(self):
+        super().server_close()
+        if self._bound and os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        self.ocr_pool.close()
+
+    def warm_up(self, ocr_langs: list[str], ocr_configs: list[str] = ("",)):
+        for lang in ocr_langs:
+            for config in ocr_configs:
+                self.ocr_pool.warm_up(lang, config)
+        if self.api_key:
+            st.translate.get_deepl_translator(self.api_key)
+
+    def handle_request(self, request: dict) -> dict:
+        command = request.get("command")
+        if command == "ping":
+            return {}
+        elif command == "ocr":
+            return {"text": self.ocr(request)}
+        elif command == "translate":
+            return {"text": self.translate(request["text"], request.get("target_lang", "DE"))}
+        elif command == "ocr_translate":
+            text = self.ocr(request)
+            return {"text": text, "translated": self.translate(text, request.get("target_lang", "DE"))}
+        else:
+            raise ValueError("Unsupported command: " + str(command))
+
+    def ocr(self, request: dict) -> str:
+        img = st.ipc.image_from_shared_memory(request["shm"], request["shape"], request["dtype"])
+        lang = request.get("lang", "eng")
+        config = request.get("config", "")
+        key = (hashlib.blake2b(img.tobytes(), digest_size=16).digest(), img.shape, lang, config)
+        with self._ocr_cache_lock:
+            if key in self._ocr_cache:
+                self._ocr_cache.move_to_end(key)
+                return self._ocr_cache[key]
+        text = self.ocr_pool.ocr_text(img, to_lang=lang, config=config)
+        with self._ocr_cache_lock:
+            self._ocr_cache[key] = text
+            if len(self._ocr_cache) > self.cache_size:
+                self._ocr_cache.popitem(last=False)
+        return text
+
+    def _translate(self, text: str, target_lang: str) -> str:
+        if not text.strip():
+            return ""
+        if not self.api_key:
+            raise ValueError("No DeepL API key configured")
+        return st.translate.translate_text_deepl(text, api_key=self.api_key, target_lang=target_lang)
+
+
+def remove_stale_socket(socket_path: str):
+    # A socket file left behind by a crashed daemon would make bind() fail
+    if not os.path.exists(socket_path):
+        return
+    st.ipc.check_socket_owner(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        try:
+            s.connect(socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(socket_path)
+        else:
+            raise RuntimeError(f"Daemon is already running on {socket_path}")
@@ -0,0 +1,72 @@
+import json
+import os
+import socket
+import tempfile
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+SOCKET_NAME = "screencap-translate.sock"
+
+def unix_sockets_available() -> bool:
+    # The daemon is optional; on other platforms the clients just do their work in-process
+    return hasattr(socket, "AF_UNIX") and hasattr(os, "getuid")
+
+def get_default_socket_path() -> str:
+    # Without XDG_RUNTIME_DIR, use a directory of our own rather than the world-writable temp dir itself
+    directory = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(tempfile.gettempdir(),
+                                                                  f"screencap-translate-{os.getuid()}")
+    return os.path.join(directory, SOCKET_NAME)
+
+def get_socket_path() -> str:
+    import config  # Only needed when no socket path is passed explicitly
+    return getattr(config, "DAEMON_SOCKET", None) or get_default_socket_path()
+
+def prepare_socket_dir(socket_path: str):
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    info = os.stat(directory)
+    if info.st_uid != os.getuid() or info.st_mode & 0o022:
+        raise PermissionError(f"Socket directory {directory} needs to be owned by and only writable for the current user")
+
+def check_socket_owner(socket_path: str):
+    # Screen contents must not be sent to (or a daemon blocked by) a socket another user has put there
+    if os.stat(socket_path).st_uid != os.getuid():
+        raise PermissionError(f"Socket {socket_path} is owned by another user")
+
+# Messages are JSON objects, one per line. Images are not sent over the socket but placed in shared memory;
+# the message only carries the name, shape and dtype of the block.
+
+def encode_message(message: dict) -> bytes:
+    return json.dumps(message).encode("utf-8") + b"\n"
+
+def decode_message(line: bytes) -> dict:
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("Message needs to be a JSON object")
+    return message
+
+def image_to_shared_memory(img: np.ndarray) -> tuple[shared_memory.SharedMemory, dict]:
+    if img.size == 0:
+        raise ValueError("Cannot share an empty image")
+    img = np.ascontiguousarray(img)
+    shm = shared_memory.SharedMemory(create=True, size=img.nbytes)
+    np.ndarray(img.shape, dtype=img.dtype, buffer=shm.buf)[:] = img
+    return shm, {"shm": shm.name, "shape": list(img.shape), "dtype": img.dtype.str}
+
+def image_from_shared_memory(name: str, shape: list[int], dtype: str) -> np.ndarray:
+    shm = _attach_shared_memory(name)
+    try:
+        # Copy, so the block can be released by the client as soon as the response is sent
+        return np.ndarray(tuple(shape), dtype=np.dtype(dtype), buffer=shm.buf).copy()
+    finally:
+        shm.close()
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    # The client owns the block, so it must not be tracked (and unlinked) on this side
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # track parameter only exists since Python 3.13
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
@@ -1,13 +1,27 @@
+import queue
+import re
+import threading
+
 import pytesseract
 import numpy as np
-import PIL
+import PIL.Image
 from .image_process import preprocess_image
 
+try:
+    import tesserocr  # Optional: keeps tesseract loaded in-process instead of starting it for every image
+except ImportError:
+    tesserocr = None
+
+PSM_PATTERN = re.compile(r"\s*(?:--psm\s+(\d+))?\s*")  # Configs that TesseractPool can serve from its engines
+DEFAULT_OCR_CONFIG = r'--psm 6'  # Assume a single uniform block of text, which fits screenshot selections
+
 def ocr_text(img : np.ndarray, to_lang : str ="eng", config : str = ""):
     #img = preprocess_image(img, "edge_detect")
     result = pytesseract.image_to_string(img, lang=to_lang, config=config)
-    result_clean = result.replace("\n", " ")
-    return result_clean
+    return clean_ocr_result(result)
+
+def clean_ocr_result(text: str) -> str:
+    return text.strip().replace("\n", " ")
 
 def binarize_PIL_image(img: PIL.Image.Image) -> PIL.Image.Image:
     greyscale = img.convert('L')
@@ -18,3 +32,75 @@ def get_available_ocr_languages() -> list[str]:
     langs.remove("osd")  # osd is not actually a language
     return langs
 
+
+class TesseractPool:
+    """Initialised tesseract engines, kept per (language, page segmentation mode) for reuse across calls.
+
+    Without tesserocr installed, or for configs with options other than --psm, this falls back to ocr_text(),
+    i.e. one tesseract process per call.
+    """
+
+    def __init__(self, size: int = 2):
+        self.size = size
+        self._engines: dict[tuple[str, int], queue.Queue] = {}
+        self._lock = threading.Lock()
+
+    def _get_queue(self, lang: str, psm: int) -> queue.Queue:
+        with self._lock:
+            if (lang, psm) not in self._engines:
+                engines = queue.Queue()
+                for _ in range(self.size):
+                    engines.put(None)  # Engines are created on first use
+                self._engines[(lang, psm)] = engines
+            return self._engines[(lang, psm)]
+
+    def warm_up(self, lang: str = "eng", config: str = ""):
+        if not self.can_serve(config):
+            return
+        psm = self._get_psm(config)
+        engines = self._get_queue(lang, psm)
+        checked_out = [engines.get() for _ in range(self.size)]
+        try:
+            for i, engine in enumerate(checked_out):
+                if engine is None:
+                    checked_out[i] = self._create_engine(lang, psm)
+        finally:
+            for engine in checked_out:
+                engines.put(engine)
+
+    def ocr_text(self, img: np.ndarray, to_lang: str = "eng", config: str = "") -> str:
+        if not self.can_serve(config):
+            return ocr_text(img, to_lang=to_lang, config=config)
+        psm = self._get_psm(config)
+        engines = self._get_queue(to_lang, psm)
+        engine = engines.get()  # Blocks while all engines for this language are busy
+        try:
+            if engine is None:
+                engine = self._create_engine(to_lang, psm)
+            engine.SetImage(PIL.Image.fromarray(img))
+            result = engine.GetUTF8Text()
+        finally:
+            engines.put(engine)
+        return clean_ocr_result(result)
+
+    def close(self):
+        with self._lock:
+            for engines in self._engines.values():
+                while not engines.empty():
+                    engine = engines.get_nowait()
+                    if engine is not None:
+                        engine.End()
+            self._engines.clear()
+
+    @staticmethod
+    def can_serve(config: str) -> bool:
+        return tesserocr is not None and PSM_PATTERN.fullmatch(config) is not None
+
+    @staticmethod
+    def _get_psm(config: str) -> int:
+        psm = PSM_PATTERN.fullmatch(config).group(1)
+        return int(psm) if psm else 3  # 3 is tesseract's default (fully automatic segmentation)
+
+    @staticmethod
+    def _create_engine(lang: str, psm: int):
+        return tesserocr.PyTessBaseAPI(lang=lang, psm=psm)
@@ -10,6 +10,7 @@ from pynput import keyboard
 import numpy as np
 
 import config
+import st.client
 import st.ocr
 import st.translate
 import st.image_process
@@ -37,6 +38,10 @@ class MainWindow(QMainWindow):
 
         self.timers = {}  # Ephemeral timers for temporary highlighting, etc.
 
+        # OCR and translation go through the background daemon if it is running, otherwise they run in-process
+        self.ocr_pool = st.ocr.TesseractPool()
+        self.daemon_client = None
+
         # Start the global hotkeys listener thread
         self.take_screenshot_signal.connect(self.take_screenshot)
         #self.take_screenshot_signal.connect(self.bring_to_foreground)
@@ -318,13 +323,48 @@ class MainWindow(QMainWindow):
 
     def translate_text(self):
         if self.ocr_text:
-            self.translated_text = st.translate.translate_text_deepl(self.ocr_text,
-                                                                     api_key=config.DEEPL_KEY,
-                                                                     target_lang=self.translation_lang_combobox.currentText())
+            self.translated_text = self.run_translation(self.ocr_text, self.translation_lang_combobox.currentText())
             self.translated_text_history += self.translated_text + "\n\n"
             self.translated_widget.setPlainText(self.translated_text)
             self.translated_history_widget.setPlainText(self.translated_text_history)
 
+    def run_ocr(self, image: np.ndarray, lang: str) -> str:
+        client = self.connect_daemon()
+        if client is not None:
+            try:
+                return client.ocr(image, lang=lang, config=st.ocr.DEFAULT_OCR_CONFIG)
+            except OSError:  # Daemon gone or not responding
+                self.disconnect_daemon()
+        return self.ocr_pool.ocr_text(image, to_lang=lang, config=st.ocr.DEFAULT_OCR_CONFIG)
+
+    def run_translation(self, text: str, target_lang: str) -> str:
+        client = self.connect_daemon()
+        if client is not None:
+            try:
+                return client.translate(text, target_lang=target_lang)
+            except OSError:
+                self.disconnect_daemon()
+        return st.translate.translate_text_deepl(text, api_key=config.DEEPL_KEY, target_lang=target_lang)
+
+    def connect_daemon(self):
+        # Tried on every request, so a daemon started (or restarted) after the GUI is picked up
+        if self.daemon_client is None:
+            try:
+                self.daemon_client = st.client.DaemonClient()
+            except OSError:  # Daemon not running
+                pass
+        return self.daemon_client
+
+    def disconnect_daemon(self):
+        self.daemon_client.close()
+        self.daemon_client = None
+
+    def closeEvent(self, event):
+        if self.daemon_client is not None:
+            self.disconnect_daemon()
+        self.ocr_pool.close()
+        super().closeEvent(event)
+
 
 class CustomGraphicsView(QGraphicsView):
     def __init__(self, parent=None):
@@ -377,7 +417,7 @@ class CustomGraphicsView(QGraphicsView):
         selection = self.get_selection_pixmap()
         if not selection.isNull():
             image = np.array(ImageQt.fromqpixmap(selection))  # Convert to numpy array that is compatible with tesseract
-            extracted_text = st.ocr.ocr_text(image, to_lang=lang, config=r'--psm 6')
+            extracted_text = self.topLevelWidget().run_ocr(image, lang)
             return extracted_text
         return ""
 
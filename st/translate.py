@@ -1,3 +1,5 @@
+import functools
+
 import deepl
 
 DEEPL_LANGUAGES = {
@@ -34,14 +36,19 @@ DEEPL_LANGUAGES = {
     "ZH": "Chinese (simplified)"
 }
 
+@functools.lru_cache(maxsize=None)
+def get_deepl_translator(api_key: str) -> deepl.Translator:
+    # One translator per key, so the underlying HTTP session (and its connection pool) is reused
+    return deepl.Translator(api_key)
+
 def get_available_deepl_languages(api_key: str) -> dict[str: str]:
     if not api_key:
         return {}
-    translator = deepl.Translator(api_key)
+    translator = get_deepl_translator(api_key)
     return {lang.code: lang.name for lang in translator.get_target_languages()}
 
 def translate_text_deepl(text: str, api_key: str, target_lang='DE') -> str:
-    translator = deepl.Translator(api_key)
+    translator = get_deepl_translator(api_key)
     result = translator.translate_text(text, target_lang=target_lang)
     return result.text
 
@@ -0,0 +1,161 @@
+import os
+import socket
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+import st.client
+import st.daemon
+import st.ipc
+import st.translate
+from st.daemon import TranslateServer
+
+IMAGE = np.full((20, 30, 3), 255, dtype=np.uint8)
+
+
+@pytest.fixture
+def ocr_calls():
+    return []
+
+@pytest.fixture
+def server(tmp_path, monkeypatch, ocr_calls):
+    server = TranslateServer(str(tmp_path / "daemon.sock"), api_key="key")
+
+    def fake_ocr(img, to_lang="eng", config=""):
+        ocr_calls.append((img.shape, to_lang, config))
+        return f"{to_lang} {img.shape[1]}x{img.shape[0]}"
+
+    monkeypatch.setattr(server.ocr_pool, "ocr_text", fake_ocr)
+    monkeypatch.setattr(st.translate, "translate_text_deepl",
+                        lambda text, api_key, target_lang="DE": f"[{target_lang}] {text}")
+    yield server
+    server.server_close()
+
+@pytest.fixture
+def running_server(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+
+@pytest.fixture
+def shared_image():
+    shm, info = st.ipc.image_to_shared_memory(IMAGE)
+    yield info
+    shm.close()
+    shm.unlink()
+
+
+def test_ping(server):
+    assert server.handle_request({"command": "ping"}) == {}
+
+def test_ocr(server, shared_image, ocr_calls):
+    response = server.handle_request({"command": "ocr", "lang": "deu", "config": "--psm 6", **shared_image})
+    assert response == {"text": "deu 30x20"}
+    assert ocr_calls == [((20, 30, 3), "deu", "--psm 6")]
+
+def test_ocr_results_are_cached(server, shared_image, ocr_calls):
+    for _ in range(3):
+        server.handle_request({"command": "ocr", **shared_image})
+    assert len(ocr_calls) == 1
+
+def test_translate(server):
+    response = server.handle_request({"command": "translate", "text": "Hello", "target_lang": "FR"})
+    assert response == {"text": "[FR] Hello"}
+
+def test_translate_skips_empty_text(server):
+    assert server.handle_request({"command": "translate", "text": "  "}) == {"text": ""}
+
+def test_translate_without_api_key(server):
+    server.api_key = ""
+    with pytest.raises(ValueError):
+        server.handle_request({"command": "translate", "text": "Hello"})
+
+def test_ocr_translate(server, shared_image):
+    response = server.handle_request({"command": "ocr_translate", "target_lang": "FR", **shared_image})
+    assert response == {"text": "eng 30x20", "translated": "[FR] eng 30x20"}
+
+def test_unknown_command(server):
+    with pytest.raises(ValueError, match="Unsupported command"):
+        server.handle_request({"command": "screenshot"})
+
+@pytest.mark.parametrize("request_", [{"command": "translate"}, {"command": "ocr"}, {"command": "ocr_translate"}])
+def test_missing_keys(server, request_):
+    with pytest.raises(KeyError):
+        server.handle_request(request_)
+
+
+def test_round_trip(running_server, monkeypatch):
+    shared_names = []
+
+    def recording_image_to_shared_memory(img):
+        shm, info = image_to_shared_memory(img)
+        shared_names.append(info["shm"])
+        return shm, info
+
+    image_to_shared_memory = st.ipc.image_to_shared_memory
+    monkeypatch.setattr(st.ipc, "image_to_shared_memory", recording_image_to_shared_memory)
+
+    with st.client.DaemonClient(running_server.server_address) as client:
+        client.ping()
+        assert client.ocr(IMAGE[5:15, 10:20]) == "eng 10x10"
+        assert client.translate("Hello", target_lang="FR") == "[FR] Hello"
+        assert client.ocr_translate(IMAGE, target_lang="IT") == ("eng 30x20", "[IT] eng 30x20")
+
+    assert len(shared_names) == 2
+    for name in shared_names:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+def test_round_trip_errors(running_server):
+    with st.client.DaemonClient(running_server.server_address) as client:
+        with pytest.raises(RuntimeError, match="ValueError: Unsupported command"):
+            client.request({"command": "screenshot"})
+        with pytest.raises(RuntimeError, match="KeyError"):
+            client.request({"command": "translate"})
+        client.ping()  # The connection stays usable after errors
+
+def test_concurrent_clients(running_server):
+    results = {}
+
+    def translate(i):
+        with st.client.DaemonClient(running_server.server_address) as client:
+            results[i] = client.translate(f"text {i}")
+
+    threads = [threading.Thread(target=translate, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {i: f"[DE] text {i}" for i in range(8)}
+
+def test_client_without_daemon(tmp_path):
+    with pytest.raises(OSError):  # What clients catch to fall back to in-process work
+        st.client.DaemonClient(str(tmp_path / "missing.sock"))
+
+def test_stale_socket_is_replaced(tmp_path):
+    socket_path = str(tmp_path / "daemon.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.bind(socket_path)  # Left behind without anyone listening, like after a crash
+    server = TranslateServer(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with st.client.DaemonClient(socket_path) as client:
+            client.ping()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_second_daemon_refuses_to_start(server):
+    with pytest.raises(RuntimeError, match="already running"):
+        TranslateServer(server.server_address)
+
+def test_losing_bind_race_keeps_running_daemons_socket(server, monkeypatch):
+    monkeypatch.setattr(st.daemon, "remove_stale_socket", lambda socket_path: None)
+    with pytest.raises(OSError):
+        TranslateServer(server.server_address)
+    assert os.path.exists(server.server_address)
@@ -0,0 +1,51 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+import st.client
+import st.ipc
+
+
+def test_message_round_trip():
+    message = {"command": "translate", "text": "Grüße\nzwei Zeilen"}
+    line = st.ipc.encode_message(message)
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    assert st.ipc.decode_message(line) == message
+
+def test_decode_message_rejects_non_objects():
+    with pytest.raises(ValueError):
+        st.ipc.decode_message(b"[1, 2]\n")
+
+def test_shared_memory_round_trip():
+    img = np.arange(4 * 6 * 3, dtype=np.uint8).reshape(4, 6, 3)[:, 1:5]  # Not contiguous, like a selected ROI
+    shm, info = st.ipc.image_to_shared_memory(img)
+    try:
+        result = st.ipc.image_from_shared_memory(info["shm"], info["shape"], info["dtype"])
+    finally:
+        shm.close()
+        shm.unlink()
+    np.testing.assert_array_equal(result, img)
+    assert result.dtype == img.dtype
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=info["shm"])
+
+def test_empty_image_is_not_shared():
+    with pytest.raises(ValueError):
+        st.ipc.image_to_shared_memory(np.zeros((0, 10, 3), dtype=np.uint8))
+
+def test_prepare_socket_dir_rejects_shared_directories(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    with pytest.raises(PermissionError):
+        st.ipc.prepare_socket_dir(str(shared / "daemon.sock"))
+
+def test_prepare_socket_dir_creates_private_directory(tmp_path):
+    st.ipc.prepare_socket_dir(str(tmp_path / "private" / "daemon.sock"))
+    assert (tmp_path / "private").stat().st_mode & 0o777 == 0o700
+
+def test_client_without_unix_sockets(monkeypatch):
+    monkeypatch.delattr(st.ipc.socket, "AF_UNIX")
+    with pytest.raises(OSError):
+        st.client.DaemonClient("unused.sock")
@@ -0,0 +1,114 @@
+import threading
+import time
+import types
+
+import numpy as np
+import pytest
+
+import st.ocr
+
+
+@pytest.mark.parametrize("config, psm", [("", 3), ("--psm 6", 6), (" --psm  11 ", 11)])
+def test_pool_serves_bare_psm_configs(monkeypatch, config, psm):
+    monkeypatch.setattr(st.ocr, "tesserocr", object())
+    assert st.ocr.TesseractPool.can_serve(config)
+    assert st.ocr.TesseractPool._get_psm(config) == psm
+
+@pytest.mark.parametrize("config", ["--psm 6 --oem 1", "-c tessedit_char_whitelist=0123456789", "--dpi 300"])
+def test_pool_falls_back_for_other_options(monkeypatch, config):
+    monkeypatch.setattr(st.ocr, "tesserocr", object())
+    assert not st.ocr.TesseractPool.can_serve(config)
+
+def test_pool_falls_back_without_tesserocr(monkeypatch):
+    monkeypatch.setattr(st.ocr, "tesserocr", None)
+    assert not st.ocr.TesseractPool.can_serve("--psm 6")
+
+def test_clean_ocr_result():
+    assert st.ocr.clean_ocr_result("first line\nsecond line\n\x0c") == "first line second line"
+
+
+class FakeEngine:
+    def __init__(self, lang, psm, log):
+        self.lang = lang
+        self.psm = psm
+        self.log = log
+        self.in_use = False
+        self.ended = False
+        self.image = None
+
+    def SetImage(self, image):
+        if self.in_use:
+            self.log["overlaps"] += 1
+        self.in_use = True
+        self.image = image
+
+    def GetUTF8Text(self):
+        time.sleep(0.01)  # Give other threads a chance to grab the same engine
+        self.in_use = False
+        return f"{self.lang} {self.psm}\n{self.image.size[0]}x{self.image.size[1]}\n"
+
+    def End(self):
+        self.ended = True
+
+
+@pytest.fixture
+def engine_log(monkeypatch):
+    log = {"engines": [], "overlaps": 0}
+
+    def create_engine(lang, psm):
+        engine = FakeEngine(lang, psm, log)
+        log["engines"].append(engine)
+        return engine
+
+    monkeypatch.setattr(st.ocr, "tesserocr", types.SimpleNamespace(PyTessBaseAPI=create_engine))
+    return log
+
+IMAGE = np.zeros((10, 20, 3), dtype=np.uint8)
+
+
+def test_pool_reuses_engines(engine_log):
+    pool = st.ocr.TesseractPool(size=2)
+    for _ in range(6):
+        assert pool.ocr_text(IMAGE, to_lang="eng", config="--psm 6") == "eng 6 20x10"
+    assert len(engine_log["engines"]) <= 2
+    assert {(e.lang, e.psm) for e in engine_log["engines"]} == {("eng", 6)}
+
+def test_pool_keeps_engines_per_language_and_psm(engine_log):
+    pool = st.ocr.TesseractPool(size=1)
+    for _ in range(2):
+        pool.ocr_text(IMAGE, to_lang="eng", config="--psm 6")
+        pool.ocr_text(IMAGE, to_lang="eng")
+        pool.ocr_text(IMAGE, to_lang="deu", config="--psm 6")
+    assert sorted((e.lang, e.psm) for e in engine_log["engines"]) == [("deu", 6), ("eng", 3), ("eng", 6)]
+
+def test_pool_does_not_share_engines_between_threads(engine_log):
+    pool = st.ocr.TesseractPool(size=2)
+    threads = [threading.Thread(target=pool.ocr_text, args=(IMAGE,)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert engine_log["overlaps"] == 0
+    assert len(engine_log["engines"]) == 2
+
+def test_pool_warm_up(engine_log):
+    pool = st.ocr.TesseractPool(size=3)
+    pool.warm_up("eng", "--psm 6")
+    assert len(engine_log["engines"]) == 3
+    pool.ocr_text(IMAGE, to_lang="eng", config="--psm 6")
+    assert len(engine_log["engines"]) == 3
+
+def test_pool_falls_back_to_ocr_text(engine_log, monkeypatch):
+    calls = []
+    monkeypatch.setattr(st.ocr, "ocr_text", lambda img, to_lang="eng", config="": calls.append(config) or "text")
+    pool = st.ocr.TesseractPool()
+    assert pool.ocr_text(IMAGE, config="--psm 6 --oem 1") == "text"
+    assert calls == ["--psm 6 --oem 1"]
+    assert engine_log["engines"] == []
+
+def test_pool_close_ends_engines(engine_log):
+    pool = st.ocr.TesseractPool(size=2)
+    pool.warm_up("eng")
+    pool.ocr_text(IMAGE, to_lang="deu")
+    pool.close()
+    assert engine_log["engines"] and all(e.ended for e in engine_log["engines"])